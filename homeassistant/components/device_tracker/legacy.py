@@ -310,6 +310,7 @@ def async_setup_scanner_platform(
     interval = config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL)
     update_lock = asyncio.Lock()
     scanner.hass = hass
+    scanner_name = scanner.__class__.__name__
 
     # Initial scan of each mac we also tell about host name for config
     seen: Any = set()
@@ -328,6 +329,7 @@ def async_setup_scanner_platform(
         async with update_lock:
             found_devices = await scanner.async_scan_devices()
 
+        zone_home = hass.states.get(hass.components.zone.ENTITY_ID_HOME)
         for mac in found_devices:
             if mac in seen:
                 host_name = None
@@ -345,12 +347,11 @@ def async_setup_scanner_platform(
                 "host_name": host_name,
                 "source_type": SOURCE_TYPE_ROUTER,
                 "attributes": {
-                    "scanner": scanner.__class__.__name__,
+                    "scanner": scanner_name,
                     **extra_attributes,
                 },
             }
 
-            zone_home = hass.states.get(hass.components.zone.ENTITY_ID_HOME)
             if zone_home:
                 kwargs["gps"] = [
                     zone_home.attributes[ATTR_LATITUDE],
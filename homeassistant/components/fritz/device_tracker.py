@@ -1,8 +1,11 @@
 """Support for FRITZ!Box routers."""
+import asyncio
 import logging
 
-from fritzconnection.core import exceptions as fritzexceptions
+from fritzconnection.core.exceptions import FritzConnectionException
 from fritzconnection.lib.fritzhosts import FritzHosts
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
 import voluptuous as vol
 
 from homeassistant.components.device_tracker import (
@@ -18,6 +21,14 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_HOST = "169.254.1.1"  # This IP is valid for all FRITZ!Box routers.
 DEFAULT_USERNAME = "admin"
 
+# Number of host entries requested from the FRITZ!Box at the same time.
+MAX_CONCURRENT_REQUESTS = 16
+# Pooled connections, leaving headroom above the concurrent sweep.
+POOL_SIZE = 2 * MAX_CONCURRENT_REQUESTS
+
+# Platform scan ticks answered from the last sweep while the network is quiet.
+MAX_SKIPPED_SCANS = 2
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Optional(CONF_HOST, default=DEFAULT_HOST): cv.string,
@@ -38,7 +49,11 @@ class FritzBoxScanner(DeviceScanner):
 
     def __init__(self, config):
         """Initialize the scanner."""
-        self.last_results = []
+        self.last_results = {}
+        self._active_hosts = []
+        self._skip_scans = 0
+        self._skipped_scans = 0
+        self._available = True
         self.host = config[CONF_HOST]
         self.username = config[CONF_USERNAME]
         self.password = config.get(CONF_PASSWORD)
@@ -49,7 +64,13 @@ class FritzBoxScanner(DeviceScanner):
             self.fritz_box = FritzHosts(
                 address=self.host, user=self.username, password=self.password
             )
-        except (ValueError, TypeError):
+            # Reading the description needs no login, so verify the
+            # credentials with one cheap authenticated action.
+            _LOGGER.debug(
+                "FRITZ!Box %s lists %s hosts", self.host, self.fritz_box.host_numbers
+            )
+        except (FritzConnectionException, RequestException) as err:
+            _LOGGER.debug("Error connecting to FRITZ!Box %s: %s", self.host, err)
             self.fritz_box = None
 
         # At this point it is difficult to tell if a connection is established.
@@ -59,7 +80,12 @@ class FritzBoxScanner(DeviceScanner):
 
         if self.success_init:
             _LOGGER.info("Successfully connected to %s", self.fritz_box.modelname)
-            self._update_info()
+            # Keep enough pooled connections for the concurrent host sweep.
+            adapter = HTTPAdapter(
+                pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=1
+            )
+            self.fritz_box.fc.session.mount("http://", adapter)
+            self.fritz_box.fc.session.mount("https://", adapter)
         else:
             _LOGGER.error(
                 "Failed to establish connection to FRITZ!Box with IP: %s", self.host
@@ -68,40 +94,134 @@ class FritzBoxScanner(DeviceScanner):
     def scan_devices(self):
         """Scan for new devices and return a list of found device ids."""
         self._update_info()
-        active_hosts = []
-        for known_host in self.last_results:
-            if known_host["status"] and known_host.get("mac"):
-                active_hosts.append(known_host["mac"])
-        return active_hosts
+        return self._active_hosts
+
+    async def async_scan_devices(self):
+        """Scan for new devices and return a list of found device ids.
+
+        The FRITZ!Box is swept on every scan right after devices changed.
+        While the network is quiet, up to MAX_SKIPPED_SCANS scans in a row
+        return the result of the last sweep instead.
+        """
+        if self._skipped_scans < self._skip_scans:
+            self._skipped_scans += 1
+            return self._active_hosts
+        self._skipped_scans = 0
+
+        previous_hosts = set(self._active_hosts)
+        if not await self._async_update_info():
+            # Back off while the FRITZ!Box cannot be reached.
+            self._set_hosts([])
+            self._skip_scans = MAX_SKIPPED_SCANS
+        elif set(self._active_hosts) != previous_hosts:
+            self._skip_scans = 0
+        else:
+            self._skip_scans = min(MAX_SKIPPED_SCANS, self._skip_scans + 1)
+        return self._active_hosts
 
     def get_device_name(self, device):
         """Return the name of the given device or None if is not known."""
-        ret = self.fritz_box.get_specific_host_entry(device).get("NewHostName")
-        if ret == {}:
+        host = self.last_results.get(device)
+        if host is None:
             return None
-        return ret
+        return host["name"]
 
     def get_extra_attributes(self, device):
         """Return the attributes (ip, mac) of the given device or None if is not known."""
-        ip_device = None
-        try:
-            ip_device = self.fritz_box.get_specific_host_entry(device).get(
-                "NewIPAddress"
-            )
-        except fritzexceptions.FritzLookUpError as fritz_lookup_error:
-            _LOGGER.warning(
-                "Host entry for %s not found: %s", device, fritz_lookup_error
-            )
+        host = self.last_results.get(device)
+        if host is None:
+            _LOGGER.warning("Host entry for %s not found", device)
+            return {}
 
+        ip_device = host["ip"]
         if not ip_device:
             return {}
         return {"ip": ip_device, "mac": device}
 
+    async def async_get_device_name(self, device):
+        """Return the name of the given device or None if is not known."""
+        return self.get_device_name(device)
+
+    async def async_get_extra_attributes(self, device):
+        """Return the attributes (ip, mac) of the given device or None if is not known."""
+        return self.get_extra_attributes(device)
+
     def _update_info(self):
         """Retrieve latest information from the FRITZ!Box."""
         if not self.success_init:
             return False
 
         _LOGGER.debug("Scanning")
-        self.last_results = self.fritz_box.get_hosts_info()
+        self._set_hosts(self.fritz_box.get_hosts_info())
+        return True
+
+    async def _async_update_info(self):
+        """Retrieve latest information from the FRITZ!Box concurrently."""
+        if not self.success_init:
+            return False
+
+        _LOGGER.debug("Scanning")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def async_get_host_entry(index):
+            async with semaphore:
+                return await self.hass.async_add_executor_job(
+                    self._get_host_entry, index
+                )
+
+        tasks = []
+        try:
+            host_numbers = await self.hass.async_add_executor_job(
+                lambda: self.fritz_box.host_numbers
+            )
+            tasks = [
+                self.hass.async_create_task(async_get_host_entry(index))
+                for index in range(host_numbers)
+            ]
+            hosts = await asyncio.gather(*tasks)
+        except (FritzConnectionException, RequestException) as err:
+            # gather() does not cancel the remaining requests on failure.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._available:
+                _LOGGER.warning("Error scanning FRITZ!Box %s: %s", self.host, err)
+                self._available = False
+            return False
+
+        if not self._available:
+            _LOGGER.info("Connection to FRITZ!Box %s restored", self.host)
+            self._available = True
+        self._set_hosts(hosts)
         return True
+
+    def _set_hosts(self, hosts):
+        """Index host entries by MAC address and collect the active ones."""
+        last_results = {}
+        for host in hosts:
+            if not host:
+                continue
+            mac = host.get("mac")
+            if not mac:
+                continue
+            # A MAC can be listed more than once; prefer its active entry.
+            if mac not in last_results or host["status"]:
+                last_results[mac] = host
+        self.last_results = last_results
+        self._active_hosts = [
+            mac for mac, host in last_results.items() if host["status"]
+        ]
+
+    def _get_host_entry(self, index):
+        """Return the host entry at index in the format of get_hosts_info."""
+        try:
+            host = self.fritz_box.get_generic_host_entry(index)
+        except IndexError:
+            # The host list shrank after the number of entries was read.
+            return None
+        return {
+            "ip": host["NewIPAddress"],
+            "name": host["NewHostName"],
+            "mac": host["NewMACAddress"],
+            "status": host["NewActive"],
+        }
@@ -17,12 +17,17 @@ import homeassistant.helpers.config_validation as cv
 
 from .const import CONF_CONNECTIONS, DEFAULT_HOST, DEFAULT_USERNAME, DOMAIN, PLATFORMS
 
+_UNIQUE_HOST_SCHEMA = vol.Schema(vol.Unique("duplicate host entries found"))
+
 
 def ensure_unique_hosts(value):
     """Validate that all configs have a unique host."""
-    vol.Schema(vol.Unique("duplicate host entries found"))(
-        [socket.gethostbyname(entry[CONF_HOST]) for entry in value]
-    )
+    resolved = {}
+    for entry in value:
+        host = entry[CONF_HOST]
+        if host not in resolved:
+            resolved[host] = socket.gethostbyname(host)
+    _UNIQUE_HOST_SCHEMA([resolved[entry[CONF_HOST]] for entry in value])
     return value
 
 
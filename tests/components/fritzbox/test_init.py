@@ -1,6 +1,7 @@
 """Tests for the AVM Fritz!Box integration."""
 from unittest.mock import Mock, call
 
+from homeassistant.components import fritzbox
 from homeassistant.components.fritzbox.const import DOMAIN as FB_DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import ENTRY_STATE_LOADED, ENTRY_STATE_NOT_LOADED
@@ -49,6 +50,7 @@ async def test_setup_duplicate_config(hass: HomeAssistantType, fritz: Mock, capl
     assert not hass.states.async_entity_ids()
     assert not hass.states.async_all()
     assert "duplicate host entries found" in caplog.text
+    assert fritzbox.socket.gethostbyname.call_count == 1
 
 
 async def test_unload_remove(hass: HomeAssistantType, fritz: Mock):